@@ -1,22 +1,41 @@
 from __future__ import annotations
 
 import math
+import sys
 from pathlib import Path
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+# ✅ garante que a RAIZ do repo entre no sys.path (para achar wizard_brain.py)
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from wizard_brain import (  # noqa: E402
+    D_COLS,
+    contar_bits,
+    contar_dezenas,
+    gerar_mascaras_novas,
+    jogos_para_bytes,
+    ler_base_xlsx,
+    mascara_para_jogo,
+    respeita_sequencia_maxima,
+)
+
 
 BASE_LIMPA_PATH = Path("base/base_limpa.xlsx")
 SAIDA_INTELIGENTE = Path("combinacoes/combinacoes_inteligentes.csv")
 
+BAIXOS_MASK = 0x3FF  # dezenas 1..10
+
 
 def carregar_base() -> pd.DataFrame:
     if not BASE_LIMPA_PATH.exists():
         raise FileNotFoundError(f"Base limpa não encontrada em: {BASE_LIMPA_PATH}")
-    df = pd.read_excel(BASE_LIMPA_PATH)
-    esperadas = ["Concurso"] + [f"D{i}" for i in range(1, 16)]
+    df = ler_base_xlsx(BASE_LIMPA_PATH)
+    esperadas = ["Concurso", *D_COLS]
     faltando = [c for c in esperadas if c not in df.columns]
     if faltando:
         raise ValueError(f"Colunas faltando na base limpa: {faltando}")
@@ -29,19 +48,8 @@ def calcular_frequencias(df: pd.DataFrame, ultimos_n: int = 200) -> tuple[np.nda
     """
     Retorna (freq_total, freq_recent) para dezenas 1..25.
     """
-    cols_dezenas = [f"D{i}" for i in range(1, 16)]
-    todos = df[cols_dezenas].to_numpy(dtype=int)
-
-    freq_total = np.zeros(26, dtype=int)
-    for linha in todos:
-        for d in linha:
-            freq_total[d] += 1
-
-    recent = df.tail(ultimos_n)[cols_dezenas].to_numpy(dtype=int)
-    freq_recent = np.zeros(26, dtype=int)
-    for linha in recent:
-        for d in linha:
-            freq_recent[d] += 1
+    freq_total = contar_dezenas(df)
+    freq_recent = contar_dezenas(df.tail(ultimos_n))
 
     return freq_total, freq_recent
 
@@ -63,72 +71,37 @@ def montar_probabilidades(freq_total: np.ndarray, freq_recent: np.ndarray) -> np
     mix = alpha * fr / fr.sum() + beta * ft / ft.sum()
 
     # leve empurrão para dezenas altas (20–25)
-    bonus_altos = np.array([0.0 if d < 20 else 0.05 for d in dezenas])
+    bonus_altos = np.where(dezenas < 20, 0.0, 0.05)
     mix = mix + bonus_altos
 
     mix = mix / mix.sum()
     return mix
 
 
-def respeita_sequencia_maxima(dezenas: List[int], max_seq_run: int = 4) -> bool:
-    dezenas = sorted(dezenas)
-    run = 1
-    for i in range(1, len(dezenas)):
-        if dezenas[i] == dezenas[i - 1] + 1:
-            run += 1
-            if run > max_seq_run:
-                return False
-        else:
-            run = 1
-    return True
-
-
 def gerar_combinacoes_inteligentes(
     n_jogos: int,
     prob: np.ndarray,
     max_seq_run: int = 4,
+    seed: Optional[int] = None,
 ) -> List[Tuple[int, ...]]:
-    dezenas = np.arange(1, 26)
-    jogos: List[Tuple[int, ...]] = []
-    seen: Set[Tuple[int, ...]] = set()
-
-    tentativas = 0
+    rng = np.random.default_rng(seed)
+    seen = np.zeros(1 << 25, dtype=bool)  # bitmap endereçado pela máscara
     max_tentativas = n_jogos * 50  # folga razoável
 
-    while len(jogos) < n_jogos and tentativas < max_tentativas:
-        tentativas += 1
-
-        escolha = np.random.choice(
-            dezenas,
-            size=15,
-            replace=False,
-            p=prob,
-        )
-        escolha_lista = sorted(int(x) for x in escolha)
-        jogo = tuple(escolha_lista)
-
-        if jogo in seen:
-            continue
-        if not respeita_sequencia_maxima(escolha_lista, max_seq_run=max_seq_run):
-            continue
-
+    def filtro(m: np.ndarray) -> np.ndarray:
+        # filtros combinados num único AND e uma única compactação do lote
+        ok = respeita_sequencia_maxima(m, max_seq_run)
         # regra simples de equilíbrio: não deixar MUITOS números muito baixos
-        qtd_baixos = sum(1 for d in escolha_lista if d <= 10)
-        if qtd_baixos > 9:
-            continue
-
-        seen.add(jogo)
-        jogos.append(jogo)
+        ok &= contar_bits(m & np.uint32(BAIXOS_MASK)) <= 9
+        return ok
 
-    return jogos
+    mascaras = gerar_mascaras_novas(rng, prob, n_jogos, filtro, seen, max_tentativas)
+    return [mascara_para_jogo(m) for m in mascaras]
 
 
 def salvar_jogos(jogos: List[Tuple[int, ...]], caminho: Path) -> None:
     caminho.parent.mkdir(parents=True, exist_ok=True)
-    with caminho.open("w", encoding="utf-8") as f:
-        for jogo in jogos:
-            linha = " ".join(f"{d:02d}" for d in jogo)
-            f.write(linha + "\n")
+    caminho.write_bytes(jogos_para_bytes(np.asarray(jogos, dtype=np.uint8)))
 
 
 def main() -> None:
@@ -13,15 +13,15 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from wizard_brain import detectar_quentes_frias, construir_bandas  # noqa: E402
+from wizard_brain import D_COLS, detectar_quentes_frias, construir_bandas, ler_base_xlsx  # noqa: E402
 
 
 def carregar_base(base_path: Path) -> pd.DataFrame:
     if not base_path.exists():
         raise FileNotFoundError(f"Base não encontrada: {base_path}")
 
-    df = pd.read_excel(base_path)
-    esperadas = ["Concurso"] + [f"D{i}" for i in range(1, 16)]
+    df = ler_base_xlsx(base_path)
+    esperadas = ["Concurso", *D_COLS]
     faltando = [c for c in esperadas if c not in df.columns]
     if faltando:
         raise ValueError(f"Colunas faltando na base: {faltando}")
@@ -38,8 +38,7 @@ def recorte(df: pd.DataFrame, ultimos: int) -> pd.DataFrame:
 
 
 def flatten_dezenas(df: pd.DataFrame) -> np.ndarray:
-    cols = [f"D{i}" for i in range(1, 16)]
-    return df[cols].to_numpy(dtype=int).ravel()
+    return df[D_COLS].to_numpy(dtype=int).ravel()
 
 
 def contagens_1a25(vals: np.ndarray) -> Dict[int, int]:
@@ -52,12 +51,11 @@ def contagens_1a25(vals: np.ndarray) -> Dict[int, int]:
 
 
 def atrasos(df: pd.DataFrame) -> Dict[int, int]:
-    cols = [f"D{i}" for i in range(1, 16)]
     ult_idx = len(df) - 1
     last_pos = {d: None for d in range(1, 26)}
 
     for i in range(len(df)):
-        row = df.loc[i, cols].astype(int).tolist()
+        row = df.loc[i, D_COLS].astype(int).tolist()
         for d in row:
             last_pos[int(d)] = i
 
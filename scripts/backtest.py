@@ -2,12 +2,20 @@ from __future__ import annotations
 
 import argparse
 import re
+import sys
 from pathlib import Path
 from typing import List, Dict
 
 import numpy as np
 import pandas as pd
 
+# garante que a RAIZ do repo entre no sys.path (para achar wizard_brain.py)
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from wizard_brain import D_COLS, contar_bits, ler_base_xlsx, matriz_para_mascaras  # noqa: E402
+
 
 def extrair_jogos_de_txt(path: Path) -> List[List[int]]:
     """
@@ -46,9 +54,9 @@ def extrair_jogos_de_txt(path: Path) -> List[List[int]]:
 
 
 def carregar_base_xlsx(base_path: Path) -> pd.DataFrame:
-    df = pd.read_excel(base_path)
+    df = ler_base_xlsx(base_path)
 
-    esperadas = ["Concurso"] + [f"D{i}" for i in range(1, 16)]
+    esperadas = ["Concurso", *D_COLS]
     faltando = [c for c in esperadas if c not in df.columns]
     if faltando:
         raise ValueError(f"Base inválida. Colunas faltando: {faltando}")
@@ -60,16 +68,15 @@ def ultimos_concursos(df: pd.DataFrame, n: int) -> pd.DataFrame:
     return df.tail(int(n)).reset_index(drop=True)
 
 
-def acertos_jogo_vs_concurso(jogo: List[int], concurso: List[int]) -> int:
-    return len(set(jogo) & set(concurso))
-
-
-def backtest_jogo(jogo: List[int], df_ultimos: pd.DataFrame) -> List[int]:
-    acertos = []
-    for _, row in df_ultimos.iterrows():
-        dezenas = [int(row[f"D{i}"]) for i in range(1, 16)]
-        acertos.append(acertos_jogo_vs_concurso(jogo, dezenas))
-    return acertos
+def backtest_jogos(jogos: List[List[int]], df_ultimos: pd.DataFrame) -> np.ndarray:
+    """
+    Acertos de cada jogo em cada concurso do recorte -> (jogos, concursos).
+    Jogos e concursos viram máscaras de 25 bits uma vez só; os acertos
+    são popcount(jogo & concurso) para todos os pares de uma vez.
+    """
+    m_jogos = matriz_para_mascaras(np.asarray(jogos, dtype=np.int64).reshape(-1, 15))
+    m_conc = matriz_para_mascaras(df_ultimos[D_COLS].to_numpy(dtype=np.int64))
+    return contar_bits(np.bitwise_and.outer(m_jogos, m_conc))
 
 
 def resumo_jogo(acertos: List[int]) -> Dict[str, float]:
@@ -181,10 +188,11 @@ def main() -> None:
     base_df = carregar_base_xlsx(base_path)
     df_ult = ultimos_concursos(base_df, args.ultimos)
 
+    acertos = backtest_jogos(jogos, df_ult)
+
     rows = []
-    for idx, jogo in enumerate(jogos, start=1):
-        acertos = backtest_jogo(jogo, df_ult)
-        r = resumo_jogo(acertos)
+    for idx, acertos_jogo in enumerate(acertos, start=1):
+        r = resumo_jogo(acertos_jogo)
         r["jogo"] = idx
         rows.append(r)
 
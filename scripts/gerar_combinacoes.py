@@ -1,72 +1,75 @@
 from __future__ import annotations
 
 import argparse
-import random
+import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-
 import numpy as np
 import pandas as pd
 
+# ✅ garante que a RAIZ do repo entre no sys.path (para achar wizard_brain.py)
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from wizard_brain import (  # noqa: E402
+    D_COLS,
+    PARES_MASK,
+    contar_bits,
+    contar_dezenas,
+    gerar_mascaras_novas,
+    jogos_para_bytes,
+    ler_base_xlsx,
+    mascaras_para_matriz,
+    matriz_para_mascaras,
+    respeita_sequencia_maxima,
+)
+
+
+# jogos como máscaras de 25 bits (bit d-1 = dezena d): filtros viram AND + popcount
+FAIXA_20A25 = 0x1F80000
+# soma das dezenas por tabela: _SOMA_BYTE[j, b] = soma das dezenas ligadas no byte j
+_SOMA_BYTE = np.array(
+    [[sum(8 * j + i + 1 for i in range(8) if (b >> i) & 1) for b in range(256)] for j in range(4)],
+    dtype=np.int64,
+)
+
+LOTE_INICIAL = 50_000
+
+
+def _soma_mascaras(m: np.ndarray) -> np.ndarray:
+    return (
+        _SOMA_BYTE[0, m & 0xFF]
+        + _SOMA_BYTE[1, (m >> 8) & 0xFF]
+        + _SOMA_BYTE[2, (m >> 16) & 0xFF]
+        + _SOMA_BYTE[3, (m >> 24) & 0xFF]
+    )
+
 
 def _load_base(path: Path) -> pd.DataFrame:
-    df = pd.read_excel(path)
-    cols = ["Concurso"] + [f"D{i}" for i in range(1, 16)]
+    df = ler_base_xlsx(path)
+    cols = ["Concurso", *D_COLS]
     df = df[cols].copy().sort_values("Concurso").reset_index(drop=True)
     return df
 
 
-def _freq(df: pd.DataFrame) -> Dict[int, int]:
-    cols = [f"D{i}" for i in range(1, 16)]
-    arr = df[cols].to_numpy(dtype=int).flatten()
-    f = {d: 0 for d in range(1, 26)}
-    for x in arr:
-        f[int(x)] += 1
-    return f
-
-
-def _recent_freq(df: pd.DataFrame, ultimos: int = 200) -> Dict[int, int]:
-    return _freq(df.tail(int(ultimos)))
-
+def _recent_freq(df: pd.DataFrame, ultimos: int = 200) -> np.ndarray:
+    return contar_dezenas(df.tail(int(ultimos)))
 
-def _respeita_consecutivos(nums: List[int], max_run: int = 4) -> bool:
-    nums = sorted(nums)
-    run = 1
-    for i in range(1, len(nums)):
-        if nums[i] == nums[i-1] + 1:
-            run += 1
-            if run > max_run:
-                return False
-        else:
-            run = 1
-    return True
 
-
-def _validar_padroes(nums: List[int]) -> bool:
-    nums = sorted(nums)
-    pares = sum(1 for x in nums if x % 2 == 0)
-    soma = sum(nums)
-    qtd_20_25 = sum(1 for x in nums if 20 <= x <= 25)
+def _validar_padroes(m: np.ndarray) -> np.ndarray:
+    """
+    Filtros sobre um lote de máscaras (uint32) -> array bool dos aprovados.
+    """
+    pares = contar_bits(m & np.uint32(PARES_MASK))
+    soma = _soma_mascaras(m)
+    qtd_20_25 = contar_bits(m & np.uint32(FAIXA_20A25))
 
     # filtros suaves (não travam demais)
-    if not (6 <= pares <= 9):
-        return False
-    if not (165 <= soma <= 240):
-        return False
-    if not (2 <= qtd_20_25 <= 7):
-        return False
-    if not _respeita_consecutivos(nums, max_run=4):
-        return False
-    return True
-
-
-def _sample_weighted(weights: Dict[int, float], k: int = 15) -> List[int]:
-    nums = list(weights.keys())
-    w = np.array([weights[n] for n in nums], dtype=float)
-    w = w / w.sum()
-    # sem reposição
-    chosen = np.random.choice(nums, size=k, replace=False, p=w)
-    return sorted([int(x) for x in chosen])
+    ok = (6 <= pares) & (pares <= 9)
+    ok &= (165 <= soma) & (soma <= 240)
+    ok &= (2 <= qtd_20_25) & (qtd_20_25 <= 7)
+    ok &= respeita_sequencia_maxima(m, 4)
+    return ok
 
 
 def main() -> None:
@@ -78,8 +81,7 @@ def main() -> None:
     ap.add_argument("--seed", type=int, default=42)
     args = ap.parse_args()
 
-    random.seed(int(args.seed))
-    np.random.seed(int(args.seed))
+    rng = np.random.default_rng(int(args.seed))
 
     base_path = Path(args.base)
     out_path = Path(args.out)
@@ -87,58 +89,37 @@ def main() -> None:
 
     df = _load_base(base_path)
 
-    f_all = _freq(df)
+    f_all = contar_dezenas(df)
     f_recent = _recent_freq(df, ultimos=int(args.ultimos))
 
-    # pesos: mistura (histórico + recente), com compressão log
-    weights: Dict[int, float] = {}
-    for d in range(1, 26):
-        a = float(f_all[d])
-        r = float(f_recent[d])
-        # peso base + tendência recente
-        w = (np.log1p(a) * 0.65) + (np.log1p(r) * 0.35)
-        # pequeno incentivo para 20..25 (observação do usuário)
-        if 20 <= d <= 25:
-            w *= 1.08
-        weights[d] = float(w)
-
-    # evita repetir concursos recentes idênticos
-    ultimos_tuplas: Set[Tuple[int, ...]] = set()
-    last_rows = df.tail(200)
-    for _, row in last_rows.iterrows():
-        nums = [int(row[f"D{i}"]) for i in range(1, 16)]
-        ultimos_tuplas.add(tuple(sorted(nums)))
+    # pesos: mistura (histórico + recente), com compressão log; vetor
+    # indexado por dezena-1
+    a = f_all[1:26].astype(float)
+    r = f_recent[1:26].astype(float)
+    # peso base + tendência recente
+    pesos = (np.log1p(a) * 0.65) + (np.log1p(r) * 0.35)
+    # pequeno incentivo para 20..25 (observação do usuário)
+    pesos[19:25] *= 1.08
+    pesos = pesos / pesos.sum()
+
+    # vistos: bitmap endereçado pela máscara; já começa com os concursos
+    # recentes, para não repetir nenhum deles
+    vistos = np.zeros(1 << 25, dtype=bool)
+    vistos[matriz_para_mascaras(df.tail(200)[D_COLS].to_numpy(dtype=int))] = True
 
     alvo = int(args.qtd)
-    vistos: Set[Tuple[int, ...]] = set()
-    out: List[str] = []
-
-    tentativas = 0
     max_tentativas = max(300000, alvo * 5)
 
-    while len(out) < alvo and tentativas < max_tentativas:
-        tentativas += 1
-        nums = _sample_weighted(weights, 15)
-        t = tuple(nums)
-
-        if t in vistos:
-            continue
-        if t in ultimos_tuplas:
-            continue
-        if not _validar_padroes(nums):
-            continue
-
-        vistos.add(t)
-        out.append(" ".join(f"{x:02d}" for x in nums))
+    # sorteio em lotes: filtros e repetição avaliados no lote inteiro
+    mascaras = gerar_mascaras_novas(rng, pesos, alvo, _validar_padroes, vistos, max_tentativas, LOTE_INICIAL)
+    n_out = len(mascaras)
 
     # salva
-    with out_path.open("w", encoding="utf-8") as f:
-        for line in out:
-            f.write(line + "\n")
+    out_path.write_bytes(jogos_para_bytes(mascaras_para_matriz(mascaras)))
 
-    print(f"✅ combinações inteligentes geradas: {len(out)}")
+    print(f"✅ combinações inteligentes geradas: {n_out}")
     print(f"📁 arquivo: {out_path}")
-    if len(out) < alvo:
+    if n_out < alvo:
         print(f"⚠️ Não atingiu o alvo {alvo}. Tente aumentar max_tentativas ou relaxar filtros.")
 
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 import pandas as pd
 
-
 # ============================================================
 #   TIPOS
 # ============================================================
@@ -17,6 +20,11 @@ class Estatisticas:
     quentes: Set[int]
     frias: Set[int]
     freq_media: float
+    # freq indexada pela dezena (posição 0 sem uso), pronta p/ NumPy
+    freq_arr: np.ndarray
+    # quentes/frias como máscaras de 25 bits (bit d-1 = dezena d)
+    quentes_mask: int
+    frias_mask: int
 
 
 @dataclass(frozen=True)
@@ -52,6 +60,10 @@ PRESET_COBERTURA = DiversidadeConfig(
 #   HELPERS
 # ============================================================
 
+# colunas das 15 dezenas na base (compartilhadas com o CLI e os scripts)
+D_COLS = [f"D{i}" for i in range(1, 16)]
+
+
 def _to_set(dezenas: Iterable[int]) -> Set[int]:
     return set(int(x) for x in dezenas)
 
@@ -73,8 +85,13 @@ def _normalizar_0_1(x: float, lo: float, hi: float) -> float:
 
 
 def _extrair_dezenas_df(df: pd.DataFrame) -> np.ndarray:
-    cols = [f"D{i}" for i in range(1, 16)]
-    return df[cols].to_numpy(dtype=int, copy=True)
+    return df[D_COLS].to_numpy(dtype=int, copy=True)
+
+
+def contar_dezenas(df: pd.DataFrame) -> np.ndarray:
+    # ocorrências por dezena nas colunas D1..D15 (índice 0 sem uso)
+    vals = df[D_COLS].to_numpy(dtype=int).ravel()
+    return np.bincount(vals[(vals >= 1) & (vals <= 25)], minlength=26)
 
 
 def _binvec_25(dezenas15: Sequence[int]) -> np.ndarray:
@@ -85,6 +102,246 @@ def _binvec_25(dezenas15: Sequence[int]) -> np.ndarray:
     return v
 
 
+# ============================================================
+#   BASE (xlsx com cache Parquet)
+# ============================================================
+
+def _ler_excel(base_path: Path) -> pd.DataFrame:
+    """
+    1ª planilha do .xlsx em modo streaming do openpyxl (read_only, só
+    valores), sem a camada de Excel do pandas. Sem openpyxl, usa pd.read_excel.
+    """
+    try:
+        import openpyxl
+    except Exception:
+        return pd.read_excel(base_path)
+
+    wb = openpyxl.load_workbook(base_path, read_only=True, data_only=True)
+    try:
+        linhas = wb.worksheets[0].iter_rows(values_only=True)
+        cabecalho = next(linhas, ())
+        dados = [r for r in linhas if any(v is not None for v in r)]
+    finally:
+        wb.close()
+    return pd.DataFrame(dados, columns=list(cabecalho))
+
+
+# memo em processo: (caminho, mtime_ns, tamanho) -> base já lida
+_BASE_MEMO: Dict[Tuple[str, int, int], pd.DataFrame] = {}
+
+# chave, nos metadados do Parquet, com o mtime/tamanho do .xlsx de origem
+_META_ORIGEM = b"wizard_origem"
+
+
+def _origem_parquet(cache: Path) -> Optional[bytes]:
+    import pyarrow.parquet as pq
+
+    meta = pq.read_schema(cache).metadata or {}
+    return meta.get(_META_ORIGEM)
+
+
+def _gravar_parquet(df: pd.DataFrame, cache: Path, origem: bytes) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    meta = dict(tabela.schema.metadata or {})
+    meta[_META_ORIGEM] = origem
+    pq.write_table(tabela.replace_schema_metadata(meta), cache)
+
+
+def ler_base_xlsx(base_path: Path) -> pd.DataFrame:
+    """
+    Lê a base pelo Parquet ao lado do .xlsx (mesmo nome, .parquet). O Parquet
+    guarda o mtime/tamanho do Excel de que saiu e só é usado se ambos forem
+    iguais aos atuais; senão é regerado. Sem pyarrow, lê o Excel direto.
+    Chamadas repetidas no mesmo processo reaproveitam a leitura anterior.
+    """
+    base_path = Path(base_path)
+    st = base_path.stat()
+    chave = (str(base_path.resolve()), st.st_mtime_ns, st.st_size)
+    if chave in _BASE_MEMO:
+        return _BASE_MEMO[chave].copy()
+
+    df = None
+    cache = base_path.with_suffix(".parquet")
+    origem = f"{st.st_mtime_ns}:{st.st_size}".encode("ascii")
+    try:
+        if cache.exists() and _origem_parquet(cache) == origem:
+            df = pd.read_parquet(cache)
+    except Exception:
+        df = None
+
+    if df is None:
+        df = _ler_excel(base_path)
+        try:
+            _gravar_parquet(df, cache, origem)
+        except Exception:
+            pass
+
+    _BASE_MEMO[chave] = df
+    return df.copy()
+
+
+# ============================================================
+#   BITMASKS (jogo -> inteiro de 25 bits)
+# ============================================================
+
+# faixas do balanceamento/bandas e dezenas pares, como máscaras de 25 bits
+FAIXA_1A9 = 0x00001FF
+FAIXA_10A18 = 0x003FE00
+FAIXA_19A25 = 0x1FC0000
+PARES_MASK = 0x0AAAAAA
+
+
+def jogo_para_mascara(dezenas: Iterable[int]) -> int:
+    """
+    Jogo -> inteiro de 25 bits (bit d-1 ligado para cada dezena d).
+    Jogos iguais, em qualquer ordem, geram a mesma máscara.
+    """
+    m = 0
+    for d in dezenas:
+        m |= 1 << (int(d) - 1)
+    return m
+
+
+def mascara_para_jogo(mascara: int) -> Tuple[int, ...]:
+    m = int(mascara)
+    return tuple(d for d in range(1, 26) if (m >> (d - 1)) & 1)
+
+
+def mascaras_para_binaria(mascaras: np.ndarray) -> np.ndarray:
+    # (N,) uint32 -> (N,25) bool de pertinência
+    m = np.asarray(mascaras, dtype=np.int64).reshape(-1)
+    return ((m[:, None] >> np.arange(25)) & 1).astype(bool)
+
+
+def mascaras_para_matriz(mascaras: np.ndarray) -> np.ndarray:
+    """
+    (N,) máscaras com 15 bits cada -> (N,15) int8 com as dezenas em ordem.
+    """
+    binaria = mascaras_para_binaria(mascaras)
+    return (np.nonzero(binaria)[1].reshape(-1, 15) + 1).astype(np.int8)
+
+
+def jogos_para_bytes(matriz: np.ndarray) -> bytes:
+    """
+    (N,15) dezenas -> texto "01 02 ... 25\n" por jogo, montado de uma vez
+    (45 bytes por linha, o layout que o wizard_cli lê pelo caminho rápido).
+    """
+    m = np.asarray(matriz, dtype=np.uint8).reshape(-1, 15)
+    linhas = np.full((len(m), 45), ord(" "), dtype=np.uint8)
+    linhas[:, 0:45:3] = m // 10 + ord("0")
+    linhas[:, 1:45:3] = m % 10 + ord("0")
+    linhas[:, 44] = ord("\n")
+    return linhas.tobytes()
+
+
+def matriz_para_mascaras(matriz: np.ndarray) -> np.ndarray:
+    """
+    (N,15) dezenas 1..25 -> (N,) uint32. Dezenas repetidas na linha colapsam
+    no mesmo bit (dá para detectar com contar_bits(...) != 15).
+    """
+    bits = np.left_shift(np.uint32(1), np.asarray(matriz, dtype=np.uint32) - np.uint32(1))
+    return np.bitwise_or.reduce(bits, axis=1).astype(np.uint32)
+
+
+# NumPy < 2.0 não tem np.bitwise_count: popcount por tabela de 16 bits (64 KB)
+if hasattr(np, "bitwise_count"):
+    _POPCNT16 = None
+else:
+    _POPCNT16 = np.unpackbits(np.arange(1 << 16, dtype=">u2").view(np.uint8)).reshape(-1, 16).sum(axis=1).astype(np.uint8)
+
+
+def contar_bits(mascaras: np.ndarray) -> np.ndarray:
+    # popcount vetorizado (np.bitwise_count existe a partir do NumPy 2.0)
+    m = np.asarray(mascaras, dtype=np.uint32)
+    if _POPCNT16 is None:
+        return np.bitwise_count(m).astype(np.int64)
+    return _POPCNT16[m & 0xFFFF].astype(np.int64) + _POPCNT16[m >> 16]
+
+
+def respeita_sequencia_maxima(mascara, max_seq_run: int):
+    """
+    Nenhuma sequência de dezenas consecutivas maior que max_seq_run.
+    Existe sequência de R+1 iff m & (m>>1) & ... & (m>>R) != 0.
+    A cadeia é montada por duplicação (bit i de acc = "run de tamanho
+    `largura` começa em i"), então custa ~log2(R) shifts em vez de R.
+    Aceita uma máscara (int -> bool) ou um array uint32 (-> array bool).
+    """
+    acc = mascara if isinstance(mascara, np.ndarray) else int(mascara)
+    alvo = int(max_seq_run) + 1
+    largura = 1
+    while largura < alvo:
+        passo = min(largura, alvo - largura)
+        acc = acc & (acc >> passo)
+        largura += passo
+    return acc == 0
+
+
+def sortear_mascaras_ponderadas(
+    rng: np.random.Generator,
+    pesos: np.ndarray,
+    n: int,
+    k: int = 15,
+) -> np.ndarray:
+    """
+    n jogos de k dezenas sem reposição, cada dezena d com peso pesos[d-1]
+    (mesma lei de np.random.choice(..., replace=False, p=pesos)), de uma vez:
+    chave log(U)/peso por dezena (Efraimidis-Spirakis) e as k maiores
+    formam o jogo. Retorna as máscaras (N,) uint32.
+    """
+    pesos = np.asarray(pesos, dtype=np.float64)
+    chaves = np.log(rng.random((int(n), len(pesos)))) / pesos
+    idx = np.argpartition(-chaves, k - 1, axis=1)[:, :k].astype(np.uint32)
+    return np.bitwise_or.reduce(np.left_shift(np.uint32(1), idx), axis=1).astype(np.uint32)
+
+
+def gerar_mascaras_novas(
+    rng: np.random.Generator,
+    pesos: np.ndarray,
+    alvo: int,
+    filtro: Callable[[np.ndarray], np.ndarray],
+    vistos: np.ndarray,
+    max_tentativas: int,
+    lote_inicial: int = 50_000,
+) -> np.ndarray:
+    """
+    Núcleo dos geradores de combinações: até `alvo` jogos inéditos, em
+    lotes de sortear_mascaras_ponderadas. filtro(m) -> bool por máscara;
+    repetidos no lote ou já marcados em `vistos` (bitmap de 2^25,
+    atualizado aqui) são descartados. O próximo lote é dimensionado pela
+    taxa de aceitação observada, até 4x lote_inicial (cada sorteio ocupa
+    ~25 floats de chave + temporários, então a memória fica limitada
+    qualquer que seja o alvo). Retorna (N,) uint32 na ordem do sorteio.
+    """
+    partes: List[np.ndarray] = []
+    n_ok = 0
+    tentativas = 0
+    lote_maximo = 4 * int(lote_inicial)
+
+    lote = int(lote_inicial)
+    while n_ok < alvo and tentativas < max_tentativas:
+        lote = min(lote, max_tentativas - tentativas)
+        tentativas += lote
+        m = sortear_mascaras_ponderadas(rng, pesos, lote)
+        m = m[filtro(m)]
+
+        _, idx = np.unique(m, return_index=True)  # 1ª ocorrência no lote
+        m = m[np.sort(idx)]
+        m = m[~vistos[m]][: alvo - n_ok]
+        vistos[m] = True
+
+        partes.append(m)
+        n_ok += len(m)
+
+        taxa = max(len(m) / lote, 1e-3)
+        lote = min(lote_maximo, max(1_000, int((alvo - n_ok) / taxa * 1.1)))
+
+    return np.concatenate(partes) if partes else np.empty(0, dtype=np.uint32)
+
+
+
 # ============================================================
 #   QUENTES/FRIAS
 # ============================================================
@@ -99,17 +356,11 @@ def detectar_quentes_frias(
         base_df = base_df.sort_values("Concurso")
 
     df = base_df.tail(int(ultimos)).reset_index(drop=True)
-    arr = _extrair_dezenas_df(df)
-
-    cont = {d: 0 for d in range(1, 26)}
-    for row in arr:
-        for d in row:
-            d = int(d)
-            if 1 <= d <= 25:
-                cont[d] += 1
+    cont = contar_dezenas(df)
 
     total_concursos = max(1, len(df))
-    freq = {d: cont[d] / total_concursos for d in range(1, 26)}
+    freq_arr = cont / total_concursos
+    freq = {d: float(freq_arr[d]) for d in range(1, 26)}
     freq_media = float(_mean(list(freq.values())))
 
     ordenado = sorted(freq.items(), key=lambda kv: kv[1], reverse=True)
@@ -118,7 +369,15 @@ def detectar_quentes_frias(
     ordenado_f = sorted(freq.items(), key=lambda kv: kv[1])
     frias = set(d for d, _ in ordenado_f[:int(top_frias)])
 
-    return Estatisticas(freq=freq, quentes=quentes, frias=frias, freq_media=freq_media)
+    return Estatisticas(
+        freq=freq,
+        quentes=quentes,
+        frias=frias,
+        freq_media=freq_media,
+        freq_arr=freq_arr,
+        quentes_mask=jogo_para_mascara(quentes),
+        frias_mask=jogo_para_mascara(frias),
+    )
 
 
 # ============================================================
@@ -177,17 +436,14 @@ def construir_bandas(base_df: pd.DataFrame, ultimos: int = 300) -> BandasModel:
         base_df = base_df.sort_values("Concurso")
 
     df = base_df.tail(int(ultimos)).reset_index(drop=True)
-    arr = _extrair_dezenas_df(df)
-
-    f1, f2, f3, pares = [], [], [], []
-    for row in arr:
-        r = [int(x) for x in row]
-        f1.append(sum(1 for d in r if 1 <= d <= 9))
-        f2.append(sum(1 for d in r if 10 <= d <= 18))
-        f3.append(sum(1 for d in r if 19 <= d <= 25))
-        pares.append(sum(1 for d in r if d % 2 == 0))
-
-    def faixa(vals: List[int], q_lo: float = 0.10, q_hi: float = 0.90) -> Tuple[int, int]:
+    # cada concurso vira máscara uma vez; faixas e pares saem por AND + popcount
+    m = matriz_para_mascaras(_extrair_dezenas_df(df))
+    f1 = contar_bits(m & np.uint32(FAIXA_1A9))
+    f2 = contar_bits(m & np.uint32(FAIXA_10A18))
+    f3 = contar_bits(m & np.uint32(FAIXA_19A25))
+    pares = contar_bits(m & np.uint32(PARES_MASK))
+
+    def faixa(vals: np.ndarray, q_lo: float = 0.10, q_hi: float = 0.90) -> Tuple[int, int]:
         lo = int(np.quantile(vals, q_lo))
         hi = int(np.quantile(vals, q_hi))
         return (min(lo, hi), max(lo, hi))
@@ -274,6 +530,11 @@ def calcular_score_inteligente(
     escolhidos: List[Tuple[int, ...]],
     bandas_model: Optional[BandasModel] = None,
 ) -> float:
+    """
+    Score de um jogo, na forma escalar original. O wizard_cli não a chama
+    mais (usa calcular_scores_estaticos + calcular_scores_dinamicos); fica
+    como referência do cálculo, que as versões vetorizadas reproduzem.
+    """
     jogo = sorted(int(x) for x in dezenas)
     jogo_set = set(jogo)
     modo = str(getattr(config, "modo", "conservador")).lower()
@@ -365,4 +626,198 @@ def calcular_score_inteligente(
     if bandas in ("soft", "hard") and bandas_model is not None:
         score -= _penal_bandas(jogo, bandas_model, bandas)
 
-    return float(score)
\ No newline at end of file
+    return float(score)
+
+# ============================================================
+#   SCORE VETORIZADO (matriz de candidatos)
+# ============================================================
+
+@lru_cache(maxsize=None)
+def _carregar_jit():
+    """
+    Kernel compilado do score dinâmico (wizard_jit.scores_dinamicos), ou
+    None sem numba. O import do numba (~0,3 s) só acontece na 1ª chamada:
+    backtest, geradores e relatórios usam wizard_brain sem nunca calcular
+    o score dinâmico.
+    """
+    try:
+        from wizard_jit import scores_dinamicos
+    except Exception:
+        return None
+    return scores_dinamicos
+
+
+# abaixo disso o custo de despachar threads supera o ganho
+_MIN_LINHAS_POR_THREAD = 50_000
+
+
+def _overlap_maximo(mascaras: np.ndarray, outras: np.ndarray, elementos_bloco: int = 1 << 20) -> np.ndarray:
+    """
+    Para cada máscara de `mascaras`, maior interseção com as máscaras de `outras`:
+    AND externo + popcount, em blocos de linhas para não materializar N x M de uma vez.
+    """
+    out = np.zeros(len(mascaras), dtype=np.int64)
+    if len(outras) == 0:
+        return out
+    mascaras = np.asarray(mascaras, dtype=np.uint32)
+    outras = np.asarray(outras, dtype=np.uint32)
+    bloco = max(1, elementos_bloco // len(outras))
+    for ini in range(0, len(mascaras), bloco):
+        inter = np.bitwise_and.outer(mascaras[ini:ini + bloco], outras)
+        out[ini:ini + bloco] = contar_bits(inter).max(axis=1)
+    return out
+
+
+def _soma_colunas(valores: np.ndarray) -> np.ndarray:
+    # soma sequencial coluna a coluna: mesma ordem de arredondamento do sum() do Python
+    acc = np.zeros(len(valores), dtype=np.float64)
+    for j in range(valores.shape[1]):
+        acc = acc + valores[:, j]
+    return acc
+
+
+def calcular_scores_estaticos(
+    matriz: np.ndarray,
+    ultimos_masks: np.ndarray,
+    freq_arr: np.ndarray,
+    quentes_mask: int,
+    frias_mask: int,
+    config,
+    bandas_model: Optional[BandasModel] = None,
+) -> np.ndarray:
+    """
+    Parte do score de calcular_score_inteligente que não muda entre as rodadas
+    gulosas: colagem nos últimos concursos, quentes/frias, balanceamento por
+    faixa, separação do modo e bandas. Calculada uma vez por amostra.
+    """
+    modo = str(getattr(config, "modo", "conservador")).lower()
+    cfg, _ = _resolver_cfg_diversidade(config)
+
+    dezenas = matriz.astype(np.intp)
+    mascaras = matriz_para_mascaras(matriz)
+
+    max_overlap = _overlap_maximo(mascaras, ultimos_masks)
+    if modo.startswith("agre"):
+        penal_recent = np.maximum(0, max_overlap - 11) * 1.0
+    else:
+        penal_recent = np.maximum(0, max_overlap - 9) * 1.4
+
+    qtd_quentes = contar_bits(mascaras & np.uint32(quentes_mask))
+    qtd_frias = contar_bits(mascaras & np.uint32(frias_mask))
+    bonus_quentes = 0.35 * np.clip((qtd_quentes - 2) / (7 - 2), 0.0, 1.0)
+    penal_frias = 0.20 * np.clip((qtd_frias - 4) / (8 - 4), 0.0, 1.0)
+
+    f1 = contar_bits(mascaras & np.uint32(FAIXA_1A9))
+    f2 = contar_bits(mascaras & np.uint32(FAIXA_10A18))
+    f3 = contar_bits(mascaras & np.uint32(FAIXA_19A25))
+    bal = np.abs(f1 - 5) + np.abs(f2 - 5) + np.abs(f3 - 5)
+    penal_balance = 0.18 * bal
+
+    score = (bonus_quentes - penal_frias) - (penal_recent + penal_balance)
+
+    mean_freq_jogo = _soma_colunas(freq_arr[dezenas]) / dezenas.shape[1]
+    mean_freq_global = _mean(freq_arr[1:26].tolist())
+    if modo.startswith("agre"):
+        score = score + cfg.peso_separacao_modo * (mean_freq_jogo - mean_freq_global)
+    else:
+        score = score - cfg.peso_separacao_modo * np.abs(mean_freq_jogo - mean_freq_global)
+
+    bandas = str(getattr(config, "bandas", "off") or "off").lower().strip()
+    if bandas in ("soft", "hard") and bandas_model is not None:
+        pares = contar_bits(mascaras & np.uint32(PARES_MASK))
+
+        def dist(x: np.ndarray, lohi: Tuple[int, int]) -> np.ndarray:
+            lo, hi = lohi
+            return np.maximum(lo - x, 0) + np.maximum(x - hi, 0)
+
+        d = (
+            dist(f1, bandas_model.f1_1a9)
+            + dist(f2, bandas_model.f2_10a18)
+            + dist(f3, bandas_model.f3_19a25)
+            + dist(pares, bandas_model.pares)
+            + dist(15 - pares, bandas_model.impares)
+        )
+        score = score - (0.90 * d if bandas == "hard" else 0.35 * d)
+
+    return score.astype(np.float64)
+
+
+def calcular_scores_dinamicos(
+    matriz: np.ndarray,
+    mascaras: np.ndarray,
+    cobertura: np.ndarray,
+    config,
+    escolhidos_masks: Sequence[int],
+) -> np.ndarray:
+    """
+    Parte do score que depende da rodada: cobertura local (`cobertura`:
+    int32[26], quantas vezes cada dezena já entrou; índice 0 sem uso),
+    dezenas novas no conjunto e penalidade de clone contra os já escolhidos
+    (`escolhidos_masks`: lista ou array uint32 das máscaras).
+    Com numba disponível, roda no kernel compilado (wizard_jit, paralelo
+    via prange); sem numba, divide as linhas entre threads.
+    """
+    cfg, _ = _resolver_cfg_diversidade(config)
+    inv_cobertura = 1.0 / (1.0 + np.asarray(cobertura, dtype=np.float64))
+    escolhidos = np.asarray(escolhidos_masks, dtype=np.uint32)
+
+    jit = _carregar_jit()
+    if jit is not None:
+        return jit(
+            np.ascontiguousarray(matriz),
+            np.asarray(mascaras, dtype=np.uint32),
+            escolhidos,
+            inv_cobertura,
+            float(cfg.peso_cobertura),
+            float(cfg.peso_overlap),
+            float(cfg.peso_jaccard),
+            int(cfg.overlap_alvo_max),
+            float(cfg.reforco_overlap_extra),
+        )
+
+    mascaras = np.asarray(mascaras, dtype=np.uint32)
+    n = len(mascaras)
+    n_threads = min(os.cpu_count() or 1, max(1, n // _MIN_LINHAS_POR_THREAD))
+    if n_threads <= 1:
+        return _scores_dinamicos_numpy(matriz, mascaras, inv_cobertura, cfg, escolhidos)
+
+    # sem numba: blocos de linhas em threads (as ufuncs/matmul do NumPy
+    # soltam o GIL; estado da rodada é só leitura e pequeno)
+    limites = np.linspace(0, n, n_threads + 1).astype(np.int64)
+    with ThreadPoolExecutor(max_workers=n_threads) as ex:
+        partes = ex.map(
+            lambda a_b: _scores_dinamicos_numpy(
+                matriz[a_b[0]:a_b[1]], mascaras[a_b[0]:a_b[1]], inv_cobertura, cfg, escolhidos
+            ),
+            zip(limites[:-1], limites[1:]),
+        )
+        return np.concatenate(list(partes))
+
+
+def _scores_dinamicos_numpy(
+    matriz: np.ndarray,
+    mascaras: np.ndarray,
+    inv_cobertura: np.ndarray,
+    cfg: DiversidadeConfig,
+    escolhidos: np.ndarray,
+) -> np.ndarray:
+    cobertura_score = _soma_colunas(inv_cobertura[matriz.astype(np.intp)])
+
+    uniao = int(np.bitwise_or.reduce(escolhidos)) if len(escolhidos) else 0
+    novas = contar_bits(np.asarray(mascaras, dtype=np.uint32) & np.uint32(~uniao & 0x1FFFFFF))
+    score = cobertura_score + cfg.peso_cobertura * novas
+
+    if len(escolhidos):
+        max_ov = _overlap_maximo(mascaras, escolhidos)
+        max_j = max_ov / (30 - max_ov)
+
+        penalty_overlap = cfg.peso_overlap * max_ov
+        penalty_jacc = cfg.peso_jaccard * max_j
+
+        extra = max_ov - cfg.overlap_alvo_max + 1
+        reforcado = penalty_overlap * (cfg.reforco_overlap_extra ** extra.astype(np.float64))
+        penalty_overlap = np.where(max_ov >= cfg.overlap_alvo_max, reforcado, penalty_overlap)
+
+        score = score - (penalty_overlap + penalty_jacc)
+
+    return score.astype(np.float64)
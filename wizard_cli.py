@@ -1,21 +1,46 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import logging
+import math
+import os
+import queue
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple, Set, Dict, Optional
+from typing import BinaryIO, Iterable, Iterator, List, Tuple, Optional, Union
 
 import numpy as np
 import pandas as pd
 
 from wizard_brain import (
+    D_COLS,
     detectar_quentes_frias,
     clusterizar_concursos,
+    ler_base_xlsx,
     construir_bandas,
-    calcular_score_inteligente,
+    calcular_scores_dinamicos,
+    calcular_scores_estaticos,
+    contar_bits,
+    mascara_para_jogo,
+    mascaras_para_matriz,
+    matriz_para_mascaras,
+    respeita_sequencia_maxima,
 )
 
 
+# diagnóstico (cache, amostragem) vai para o log em stderr; o stdout fica só
+# com o relatório, que os workflows gravam em outputs/*.txt
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(".cache")
+CACHE_MAX_ARQUIVOS = 8
+_VERSAO_AMOSTRA = "L1"  # mude ao alterar o algoritmo de amostragem (invalida o cache)
+_VERSAO_PARSER = "P2"  # mude ao alterar _ler_blocos_* ou _mascaras_validas (invalida o cache)
+
+
 @dataclass
 class WizardConfig:
     modo: str
@@ -54,8 +79,8 @@ def carregar_base(base_path: Path) -> pd.DataFrame:
     if not base_path.exists():
         raise FileNotFoundError(f"Base histórica não encontrada em: {base_path}")
 
-    df = pd.read_excel(base_path)
-    esperadas = ["Concurso"] + [f"D{i}" for i in range(1, 16)]
+    df = ler_base_xlsx(base_path)
+    esperadas = ["Concurso", *D_COLS]
     faltando = [c for c in esperadas if c not in df.columns]
     if faltando:
         raise ValueError(f"Colunas faltando na base: {faltando}")
@@ -69,88 +94,327 @@ def pegar_ultimos_concursos(df: pd.DataFrame, n: int) -> pd.DataFrame:
     return df.tail(int(n)).reset_index(drop=True)
 
 
-def respeita_sequencia_maxima(dezenas: List[int], max_seq_run: int) -> bool:
-    dezenas = sorted(dezenas)
-    run = 1
-    for i in range(1, len(dezenas)):
-        if dezenas[i] == dezenas[i - 1] + 1:
-            run += 1
-            if run > max_seq_run:
-                return False
-        else:
-            run = 1
-    return True
+# layout gerado por scripts/gerar_combinacoes.py: "01 02 ... 25\n"
+# (15 dezenas de 2 dígitos + 14 espaços + quebra de linha)
+_LARGURA_LINHA = 45
 
 
-def _parse_linha_jogo(jogo_str: str) -> List[int] | None:
-    jogo_str = (jogo_str or "").strip()
-    if not jogo_str:
-        return None
+def _ler_blocos_largura_fixa(f: BinaryIO, linhas_bloco: int = 100_000) -> Iterator[np.ndarray]:
+    """
+    Caminho rápido para o layout fixo: lê bytes crus e converte os dígitos com
+    aritmética NumPy, sem parser de CSV. Para na primeira linha fora do layout
+    (ou no resto incompleto do arquivo), deixando `f` posicionado nela.
+    """
+    while True:
+        ini = f.tell()
+        buf = f.read(_LARGURA_LINHA * linhas_bloco)
+        n = len(buf) // _LARGURA_LINHA
+        if n == 0:
+            f.seek(ini)
+            return
+
+        linhas = np.frombuffer(buf, dtype=np.uint8, count=n * _LARGURA_LINHA).reshape(n, _LARGURA_LINHA)
+        dezena = linhas[:, 0:44:3] - np.uint8(48)  # uint8: não-dígito dá >= 10
+        unidade = linhas[:, 1:45:3] - np.uint8(48)
+        ok = (linhas[:, 2:44:3] == 32).all(axis=1) & (linhas[:, 44] == 10)
+        ok &= ((dezena < 10) & (unidade < 10)).all(axis=1)
+
+        n_ok = n if ok.all() else int(np.argmin(ok))
+        if n_ok:
+            yield dezena[:n_ok].astype(np.int16) * 10 + unidade[:n_ok]
+        if n_ok < n or len(buf) < _LARGURA_LINHA * linhas_bloco:
+            f.seek(ini + n_ok * _LARGURA_LINHA)
+            return
+
+
+def _ler_blocos_pandas(origem: Union[Path, BinaryIO], tamanho: int = 100_000) -> Iterator[np.ndarray]:
+    """
+    Lê o arquivo de combinações em blocos (N,15) com o parser C do pandas.
+    Linhas curtas/não numéricas viram NaN; linhas com campos a mais são puladas.
+    """
+    reader = pd.read_csv(
+        origem,
+        sep=r"\s+",
+        header=None,
+        names=range(15),
+        index_col=False,
+        engine="c",
+        chunksize=tamanho,
+        on_bad_lines="skip",
+    )
+    for chunk in reader:
+        if not all(pd.api.types.is_numeric_dtype(dt) for dt in chunk.dtypes):
+            chunk = chunk.apply(pd.to_numeric, errors="coerce")
+        yield chunk.to_numpy(dtype=np.float64)
+
+
+def _ler_blocos_combinacoes(comb_path: Path) -> Iterator[np.ndarray]:
+    """
+    Lê o arquivo de combinações em blocos (N,15): layout fixo direto dos bytes
+    enquanto der; o que sobrar (outro formato, espaços/tabs a mais, linhas
+    quebradas, cabeçalho) segue pelo parser do pandas a partir daquele ponto,
+    que separa por qualquer espaço em branco como o split() de antes.
+    """
+    with open(comb_path, "rb") as f:
+        yield from _ler_blocos_largura_fixa(f)
+        if f.tell() < os.fstat(f.fileno()).st_size:
+            yield from _ler_blocos_pandas(f)
+
+
+def _mascaras_validas(bloco: np.ndarray) -> np.ndarray:
+    """
+    Bloco (N,15) -> máscaras dos jogos válidos (15 dezenas distintas em 1..25).
+    """
+    ok = ((bloco >= 1) & (bloco <= 25)).all(axis=1)
+    if bloco.dtype.kind == "f":
+        ok &= (bloco == np.floor(bloco)).all(axis=1)  # NaN já cai no teste acima
+    mascaras = matriz_para_mascaras(bloco[ok].astype(np.int64))
+    return mascaras[contar_bits(mascaras) == 15]
+
+
+class _ErroPrefetch:
+    def __init__(self, erro: BaseException) -> None:
+        self.erro = erro
+
+
+_FIM_PREFETCH = object()
+
+
+def _prefetch(itens: Iterable, tamanho_fila: int = 2) -> Iterator:
+    """
+    Consome `itens` numa thread de fundo, até `tamanho_fila` itens à frente
+    de quem lê: o parse do próximo bloco (NumPy/parser C do pandas soltam o GIL)
+    sobrepõe o processamento do atual. Erros da thread são relançados aqui.
+    """
+    fila: queue.Queue = queue.Queue(maxsize=tamanho_fila)
+    parar = threading.Event()
+
+    def entregar(item) -> bool:
+        while not parar.is_set():
+            try:
+                fila.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produtor() -> None:
+        try:
+            for item in itens:
+                if not entregar(item):
+                    return
+            entregar(_FIM_PREFETCH)
+        except BaseException as e:  # repassa para o consumidor
+            entregar(_ErroPrefetch(e))
+
+    t = threading.Thread(target=produtor, name="prefetch-combinacoes", daemon=True)
+    t.start()
+    try:
+        while True:
+            item = fila.get()
+            if item is _FIM_PREFETCH:
+                return
+            if isinstance(item, _ErroPrefetch):
+                raise item.erro
+            yield item
+    finally:
+        parar.set()
+
+
+def _hash_curto(*partes) -> str:
+    h = hashlib.blake2b(digest_size=8)
+    for parte in partes:
+        h.update(f"{parte}|".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _mascaras_combinacoes(
+    comb_path: Path,
+    cache_dir: Path = CACHE_DIR,
+    tamanho: int = 100_000,
+) -> Iterator[np.ndarray]:
+    """
+    Máscaras (uint32) dos jogos válidos do arquivo de combinações, em blocos
+    e na ordem do arquivo. A primeira leitura grava
+    .cache/combinacoes_<arquivo>_<versão>.npy (4 B por jogo em vez de ~45 B
+    de texto), com o parse numa thread à frente do consumo; as seguintes
+    leem o .npy por mmap, sem parser nenhum.
+    O cache é refeito quando o CSV muda (mtime/tamanho) ou o parser muda
+    (_VERSAO_PARSER).
+    """
+    st = comb_path.stat()
+    prefixo = f"combinacoes_{_hash_curto(comb_path.resolve())}_"
+    arq = cache_dir / f"{prefixo}{_hash_curto(_VERSAO_PARSER, st.st_mtime_ns, st.st_size)}.npy"
+
+    todas: Optional[np.ndarray] = None
+    if arq.exists():
+        try:
+            todas = np.load(arq, mmap_mode="r")
+            if todas.dtype != np.uint32 or todas.ndim != 1:
+                todas = None
+        except (OSError, ValueError):
+            todas = None
+    # o yield fica fora do try: uma falha depois do 1º bloco não pode cair
+    # no parse do CSV e repetir blocos já entregues
+    if todas is not None:
+        logger.info("♻️ Combinações lidas do cache: %s (%d jogos)", arq, len(todas))
+        for ini in range(0, len(todas), tamanho):
+            yield np.asarray(todas[ini:ini + tamanho])
+        return
+
+    partes: List[np.ndarray] = []
+    for mascaras in _prefetch(_mascaras_validas(b) for b in _ler_blocos_combinacoes(comb_path)):
+        partes.append(mascaras)
+        yield mascaras
+
+    # só chega aqui se o arquivo foi lido até o fim
     try:
-        dezenas = [int(x) for x in jogo_str.split()]
-    except ValueError:
-        return None
-    if len(dezenas) != 15:
-        return None
-    if any(d < 1 or d > 25 for d in dezenas):
-        return None
-    if len(set(dezenas)) != 15:
-        return None
-    return sorted(dezenas)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for velho in cache_dir.glob(f"{prefixo}*.npy"):
+            velho.unlink(missing_ok=True)
+        tmp = arq.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.concatenate(partes) if partes else np.empty(0, dtype=np.uint32))
+        os.replace(tmp, arq)
+    except OSError:
+        pass
+
+
+def _pulo_algoritmo_l(rng: np.random.Generator, w: float) -> int:
+    # quantas linhas válidas avançar até a próxima troca (>= 1)
+    return int(math.floor(math.log(1.0 - rng.random()) / math.log1p(-w))) + 1
 
 
 def amostrar_candidatos(
     comb_path: Path,
-    ultimos_tuplas: Set[Tuple[int, ...]],
+    ultimos_masks: np.ndarray,
     max_seq_run: int,
     k: int,
     seed: int,
-) -> List[Tuple[int, ...]]:
+    cache_dir: Path = CACHE_DIR,
+) -> np.ndarray:
     """
-    Reservoir sampling: amostra k candidatos sem viés de ordem.
+    Reservoir sampling (Algoritmo L): amostra k candidatos sem viés de ordem.
+    Cada bloco do arquivo é filtrado de uma vez (validade, sequência máxima e
+    um único teste contra últimos concursos + repetidos); depois de cheio, o
+    reservatório só sorteia quantas linhas válidas pular até a próxima troca,
+    em vez de um sorteio por linha. Retorna as máscaras (uint32) dos jogos amostrados.
     """
     rng = np.random.default_rng(seed)
 
     if not comb_path.exists():
         raise FileNotFoundError(f"Arquivo de combinações não encontrado: {comb_path}")
 
-    amostra: List[Tuple[int, ...]] = []
-    vistos: Set[Tuple[int, ...]] = set()
+    k = int(k)
+    amostra = np.empty(k, dtype=np.uint32)
+    n_amostra = 0
+    # bloqueados: últimos concursos + máscaras válidas já lidas, num bitmap
+    # endereçado pela própria máscara (2^25 posições, 32 MB); um único teste
+    # O(1) por jogo cobre "saiu recentemente" e "repetido"
+    vistos = np.zeros(1 << 25, dtype=bool)
+    vistos[np.asarray(ultimos_masks, dtype=np.uint32)] = True
 
-    chunk_size = 50_000
-    reader = pd.read_csv(comb_path, header=None, chunksize=chunk_size)
+    # Algoritmo L: índice (entre os válidos) da próxima troca no reservatório
+    w = 1.0
+    proximo = -1
 
     n_validos = 0
-    for chunk in reader:
-        for _, row in chunk.iterrows():
-            jogo_str = str(row.iloc[0])
-            dezenas = _parse_linha_jogo(jogo_str)
-            if dezenas is None:
-                continue
-
-            jogo_tupla = tuple(dezenas)
-
-            if jogo_tupla in ultimos_tuplas:
-                continue
+    for mascaras in _mascaras_combinacoes(comb_path, cache_dir):
+        mascaras = mascaras[respeita_sequencia_maxima(mascaras, max_seq_run)]
+
+        # repetidos dentro do bloco (mantém a 1ª ocorrência), depois bloqueados
+        _, idx_u = np.unique(mascaras, return_index=True)
+        mascaras = mascaras[np.sort(idx_u)]
+        mascaras = mascaras[~vistos[mascaras]]
+        vistos[mascaras] = True
+        if len(mascaras) == 0:
+            continue
+
+        livres = min(k - n_amostra, len(mascaras))
+        amostra[n_amostra:n_amostra + livres] = mascaras[:livres]
+        n_amostra += livres
+
+        if n_amostra == k and k > 0:
+            if proximo < 0:
+                w = math.exp(math.log(1.0 - rng.random()) / k)
+                proximo = (k - 1) + _pulo_algoritmo_l(rng, w)
+            # só as linhas sorteadas para troca são tocadas
+            fim = n_validos + len(mascaras)
+            while proximo < fim:
+                amostra[int(rng.integers(0, k))] = mascaras[proximo - n_validos]
+                w *= math.exp(math.log(1.0 - rng.random()) / k)
+                proximo += _pulo_algoritmo_l(rng, w)
+
+        n_validos += len(mascaras)
+
+    logger.info("Amostragem: %d candidatos de %d jogos válidos", n_amostra, n_validos)
+    return amostra[:n_amostra].copy()
+
+
+def _chave_amostra(
+    comb_path: Path,
+    ultimos_masks: np.ndarray,
+    max_seq_run: int,
+    k: int,
+    seed: int,
+) -> str:
+    st = comb_path.stat()
+    h = hashlib.blake2b(digest_size=16)
+    for parte in (_VERSAO_AMOSTRA, _VERSAO_PARSER, comb_path.resolve(), st.st_mtime_ns, st.st_size, seed, k, max_seq_run):
+        h.update(f"{parte}|".encode("utf-8"))
+    h.update(np.sort(np.asarray(ultimos_masks, dtype=np.uint32)).tobytes())
+    return h.hexdigest()
 
-            if not respeita_sequencia_maxima(dezenas, max_seq_run):
-                continue
 
-            if jogo_tupla in vistos:
-                continue
+def amostrar_candidatos_cache(
+    comb_path: Path,
+    ultimos_masks: np.ndarray,
+    max_seq_run: int,
+    k: int,
+    seed: int,
+    cache_dir: Path = CACHE_DIR,
+) -> np.ndarray:
+    """
+    amostrar_candidatos memoizado em disco: a amostra é determinística em
+    (seed, k, max_seq_run, últimos concursos, arquivo de combinações), então
+    reexecuções reaproveitam o .npy em vez de varrer o CSV de novo.
+    Mantém só os CACHE_MAX_ARQUIVOS usados mais recentemente.
+    """
+    if not comb_path.exists():
+        raise FileNotFoundError(f"Arquivo de combinações não encontrado: {comb_path}")
 
-            n_validos += 1
+    chave = _chave_amostra(comb_path, ultimos_masks, max_seq_run, k, seed)
+    arq = cache_dir / f"candidatos_{chave}.npy"
+    if arq.exists():
+        try:
+            amostra = np.load(arq)
+            os.utime(arq)  # marca como usado (LRU)
+            logger.info("♻️ Amostra de candidatos reaproveitada do cache: %s", arq)
+            return amostra
+        except (OSError, ValueError):
+            pass
+
+    amostra = amostrar_candidatos(
+        comb_path=comb_path,
+        ultimos_masks=ultimos_masks,
+        max_seq_run=max_seq_run,
+        k=k,
+        seed=seed,
+        cache_dir=cache_dir,
+    )
 
-            if len(amostra) < k:
-                amostra.append(jogo_tupla)
-                vistos.add(jogo_tupla)
-            else:
-                j = int(rng.integers(0, n_validos))
-                if j < k:
-                    antigo = amostra[j]
-                    vistos.discard(antigo)
-                    amostra[j] = jogo_tupla
-                    vistos.add(jogo_tupla)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = arq.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, amostra)
+        os.replace(tmp, arq)
+
+        antigos = sorted(cache_dir.glob("candidatos_*.npy"), key=lambda q: q.stat().st_mtime, reverse=True)
+        for velho in antigos[CACHE_MAX_ARQUIVOS:]:
+            velho.unlink(missing_ok=True)
+    except OSError:
+        pass
 
     return amostra
 
@@ -160,9 +424,9 @@ def escolher_jogos(
     ultimos_df: pd.DataFrame,
     base_df: pd.DataFrame,
     config: WizardConfig,
-    freq: Dict[int, float],
-    quentes: Set[int],
-    frias: Set[int],
+    freq_arr: np.ndarray,
+    quentes_mask: int,
+    frias_mask: int,
     modelo_cluster,
 ) -> List[Tuple[int, ...]]:
     modo = config.modo
@@ -174,86 +438,87 @@ def escolher_jogos(
     print(f"Preset: {config.preset} (param: {config.preset_param})")
     print(f"Bandas: {config.bandas}")
 
-    # tuplas dos últimos concursos (evitar repetição exata)
-    ultimos_tuplas: Set[Tuple[int, ...]] = set()
-    for _, linha in ultimos_df.iterrows():
-        dezenas_ult = [int(linha[f"D{i}"]) for i in range(1, 16)]
-        ultimos_tuplas.add(tuple(sorted(dezenas_ult)))
+    # máscaras dos últimos concursos (evitar repetição exata), ordenadas e únicas
+    ultimos_arr = np.unique(
+        matriz_para_mascaras(ultimos_df[D_COLS].to_numpy(dtype=np.int64))
+    )
 
     # Bandas (model)
     bandas_model = None
     if str(config.bandas).lower() in ("soft", "hard"):
         bandas_model = construir_bandas(base_df, ultimos=int(config.ultimos))
 
-    candidatos = amostrar_candidatos(
+    candidatos = amostrar_candidatos_cache(
         comb_path=comb_path,
-        ultimos_tuplas=ultimos_tuplas,
+        ultimos_masks=ultimos_arr,
         max_seq_run=config.max_seq_run,
         k=config.candidatos_amostragem,
         seed=config.seed,
     )
 
-    if not candidatos:
+    if len(candidatos) == 0:
         print("⚠️ Nenhum candidato válido encontrado na amostragem.")
         return []
 
-    escolhidos: List[Tuple[int, ...]] = []
-    cobertura_contagem: Dict[int, int] = {d: 0 for d in range(1, 26)}
-    candidatos_restantes = candidatos.copy()
-
-    for _ in range(finais):
-        melhor = None
-        melhor_score = -1e18
-
-        for jogo_tupla in candidatos_restantes:
-            dezenas = list(jogo_tupla)
-
-            score = calcular_score_inteligente(
-                dezenas=dezenas,
-                ultimos_tuplas=ultimos_tuplas,
-                cobertura_contagem=cobertura_contagem,
-                quentes=quentes,
-                frias=frias,
-                freq=freq,
-                modelo_cluster=modelo_cluster,
-                config=config,
-                escolhidos=escolhidos,
-                bandas_model=bandas_model,
-            )
-
-            if score > melhor_score:
-                melhor_score = score
-                melhor = jogo_tupla
-
-        if melhor is None:
-            break
+    # máscaras aceitas, pré-alocadas; a rodada só enxerga escolhidos[:n_escolhidos]
+    escolhidos = np.empty(max(0, min(finais, len(candidatos))), dtype=np.uint32)
+    n_escolhidos = 0
+    cobertura = np.zeros(26, dtype=np.int32)  # por dezena; índice 0 sem uso
+
+    # matriz (N,15): cada rodada é um único passe score -> limiar ->
+    # atualização de cobertura. A parte estática do score é calculada uma vez
+    # e já carrega os jogos escolhidos como -inf; por rodada, só a dinâmica.
+    matriz = mascaras_para_matriz(candidatos)
+
+    estaticos = calcular_scores_estaticos(
+        matriz=matriz,
+        ultimos_masks=ultimos_arr,
+        freq_arr=freq_arr,
+        quentes_mask=quentes_mask,
+        frias_mask=frias_mask,
+        config=config,
+        bandas_model=bandas_model,
+    )
+
+    for _ in range(len(escolhidos)):
+        scores = calcular_scores_dinamicos(
+            matriz=matriz,
+            mascaras=candidatos,
+            cobertura=cobertura,
+            config=config,
+            escolhidos_masks=escolhidos[:n_escolhidos],
+        )
+        scores += estaticos
+
+        i_melhor = int(np.argmax(scores))
+        melhor_score = float(scores[i_melhor])
 
         if melhor_score < config.min_score:
             break
 
-        escolhidos.append(melhor)
-        for d in melhor:
-            cobertura_contagem[int(d)] += 1
+        escolhidos[n_escolhidos] = candidatos[i_melhor]
+        n_escolhidos += 1
+        cobertura[matriz[i_melhor]] += 1
 
-        candidatos_restantes = [c for c in candidatos_restantes if c != melhor]
+        estaticos[i_melhor] = -np.inf
 
-    return escolhidos
+    return [mascara_para_jogo(m) for m in escolhidos[:n_escolhidos]]
 
 
 def imprimir_resumo(jogos: List[Tuple[int, ...]], config: WizardConfig) -> None:
-    print("\n========================================")
-    print("        JOGOS GERADOS PELO WIZARD       ")
-    print("========================================")
-    print(f"Modo: {config.modo}")
-    print(f"Jogos finais: {len(jogos)}")
-    print(f"Preset: {config.preset} (param: {config.preset_param})")
-    print(f"Bandas: {config.bandas}\n")
-
-    for idx, jogo in enumerate(jogos, start=1):
-        seq = " ".join(f"{d:02d}" for d in jogo)
-        print(f"Jogo {idx:02d}: {seq}")
-
-    print("\nBoa sorte! 🍀")
+    # relatório montado inteiro e escrito numa chamada só
+    linhas = [
+        "\n========================================",
+        "        JOGOS GERADOS PELO WIZARD       ",
+        "========================================",
+        f"Modo: {config.modo}",
+        f"Jogos finais: {len(jogos)}",
+        f"Preset: {config.preset} (param: {config.preset_param})",
+        f"Bandas: {config.bandas}\n",
+    ]
+    linhas += [f"Jogo {idx:02d}: " + " ".join(f"{d:02d}" for d in jogo) for idx, jogo in enumerate(jogos, start=1)]
+    linhas.append("\nBoa sorte! 🍀")
+    sys.stdout.write("\n".join(linhas) + "\n")
 
 
 def main() -> None:
@@ -280,6 +545,8 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     base_path = Path("base/base_limpa.xlsx")
     comb_path = Path("combinacoes/combinacoes_inteligentes.csv")
 
@@ -314,9 +581,10 @@ def main() -> None:
     ultimos_df = pegar_ultimos_concursos(base_df, config.ultimos)
 
     estat = detectar_quentes_frias(base_df, ultimos=min(600, max(50, config.ultimos)))
-    freq = estat.freq
-    quentes = estat.quentes
-    frias = estat.frias
+    # vetor/máscaras de bits (sem dict/set no caminho quente)
+    freq_arr = estat.freq_arr
+    quentes_mask = estat.quentes_mask
+    frias_mask = estat.frias_mask
 
     modelo_cluster = clusterizar_concursos(base_df)
 
@@ -325,9 +593,9 @@ def main() -> None:
         ultimos_df=ultimos_df,
         base_df=base_df,
         config=config,
-        freq=freq,
-        quentes=quentes,
-        frias=frias,
+        freq_arr=freq_arr,
+        quentes_mask=quentes_mask,
+        frias_mask=frias_mask,
         modelo_cluster=modelo_cluster,
     )
 
@@ -0,0 +1,70 @@
+"""
+Kernel numba do score dinâmico do wizard_brain.
+
+Fica num módulo próprio para que só seja importado (e compilado) quando
+calcular_scores_dinamicos é chamado com numba instalado; o cache=True
+guarda a compilação em __pycache__ entre execuções.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def popcount_escalar(x):
+    x = x - ((x >> 1) & 0x55555555)
+    x = (x & 0x33333333) + ((x >> 2) & 0x33333333)
+    x = (x + (x >> 4)) & 0x0F0F0F0F
+    return ((x * 0x01010101) & 0xFFFFFFFF) >> 24
+
+
+@njit(parallel=True, cache=True)
+def scores_dinamicos(
+    matriz,
+    mascaras,
+    escolhidos,
+    inv_cobertura,
+    peso_cobertura,
+    peso_overlap,
+    peso_jaccard,
+    overlap_alvo_max,
+    reforco_overlap_extra,
+):
+    # mesmo cálculo de calcular_scores_dinamicos, uma linha por iteração;
+    # linhas independentes -> prange distribui entre os núcleos.
+    # Sem fastmath: a ordem das somas fica igual à versão NumPy.
+    n = matriz.shape[0]
+    out = np.empty(n, dtype=np.float64)
+
+    uniao = 0
+    for g in range(escolhidos.shape[0]):
+        uniao |= np.int64(escolhidos[g])
+
+    for i in prange(n):
+        m = np.int64(mascaras[i])
+
+        cobertura_score = 0.0
+        for j in range(matriz.shape[1]):
+            cobertura_score += inv_cobertura[matriz[i, j]]
+
+        novas = popcount_escalar(m & ~uniao)
+        score = cobertura_score + peso_cobertura * novas
+
+        if escolhidos.shape[0] > 0:
+            max_ov = 0
+            for g in range(escolhidos.shape[0]):
+                c = popcount_escalar(m & np.int64(escolhidos[g]))
+                if c > max_ov:
+                    max_ov = c
+            penalty_overlap = peso_overlap * max_ov
+            penalty_jacc = peso_jaccard * (max_ov / (30 - max_ov))
+            if max_ov >= overlap_alvo_max:
+                penalty_overlap = penalty_overlap * (
+                    reforco_overlap_extra ** float(max_ov - overlap_alvo_max + 1)
+                )
+            score = score - (penalty_overlap + penalty_jacc)
+
+        out[i] = score
+    return out